@@ -2,16 +2,34 @@
 Django admin customization for User and Task models.
 """
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
 from core import models
 
 
+class OnlyFieldsChangeList(ChangeList):
+    """Changelist that loads only the columns the list page renders."""
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.only(*self.model_admin.changelist_only_fields)
+
+
 class UserAdmin(BaseUserAdmin):
     """Define the admin pages for users."""
     ordering = ['id']
     list_display = ['email', 'name', 'is_active', 'is_staff', 'is_superuser']
+    changelist_only_fields = [
+        'id',
+        'email',
+        'name',
+        'is_active',
+        'is_staff',
+        'is_superuser',
+        'last_login',
+    ]
     list_filter = ['is_active', 'is_staff', 'is_superuser']
     search_fields = ['email', 'name']
     list_per_page = 25
@@ -46,13 +64,28 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def get_changelist(self, request, **kwargs):
+        """Use a changelist that skips unrendered user columns."""
+        return OnlyFieldsChangeList
+
 
 class TaskAdmin(admin.ModelAdmin):
     """Define the admin pages for tasks."""
     list_display = ['title', 'user', 'status', 'created_at', 'updated_at']
+    list_select_related = ('user',)
+    changelist_only_fields = [
+        'id',
+        'title',
+        'user',
+        'status',
+        'created_at',
+        'updated_at',
+    ]
     list_filter = ['status', 'created_at', 'updated_at']
     search_fields = ['title', 'description']
     list_per_page = 25
+    # Includes the pk so the changelist doesn't append its own tiebreaker
+    ordering = ('-created_at', '-id')
     date_hierarchy = 'created_at'
     readonly_fields = ['created_at', 'updated_at']
     fieldsets = (
@@ -61,6 +94,14 @@ class TaskAdmin(admin.ModelAdmin):
         (_('Timestamps'), {'fields': ('created_at', 'updated_at')}),
     )
 
+    def get_queryset(self, request):
+        """Join the owning user so rows don't fetch it one by one."""
+        return super().get_queryset(request).select_related('user')
+
+    def get_changelist(self, request, **kwargs):
+        """Use a changelist that skips the task description."""
+        return OnlyFieldsChangeList
+
 
 admin.site.register(models.User, UserAdmin)
 admin.site.register(models.Task, TaskAdmin)
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Exception handling for the API.
+"""
+import logging
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler, set_rollback
+
+logger = logging.getLogger(__name__)
+
+
+def api_exception_handler(exc, context):
+    """Handle API exceptions, turning unexpected errors into a 500 response.
+
+    DRF's own handler covers APIException, Http404 and PermissionDenied.
+    Anything else is logged with its traceback and answered with a generic
+    error so internals are not leaked to clients. Since the error is
+    handled here, it no longer reaches Django's got_request_exception
+    signal or the DEBUG traceback page; the log entry is the only record.
+    """
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    logger.error('Unhandled API error', exc_info=exc)
+    # Roll back any atomic request transaction, as DRF's handler does
+    set_rollback()
+    return Response(
+        {'error': 'An unexpected error occurred'},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
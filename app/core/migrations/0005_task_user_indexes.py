@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 21:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_rename_update_at_user_updated_at_alter_task_priority_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', '-created_at'], name='task_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['user', '-id'], name='task_user_id_idx'),
+        ),
+    ]
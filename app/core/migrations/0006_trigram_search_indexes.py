@@ -0,0 +1,45 @@
+"""
+Add pg_trgm GIN indexes backing admin and API substring search.
+
+Django compiles ``icontains`` on PostgreSQL to
+``UPPER(column::text) LIKE UPPER(%s)``, so the indexes are built on
+``UPPER(column)`` to be usable by those queries. Other database backends
+have no trigram support and skip this migration.
+"""
+from django.db import migrations
+
+TRIGRAM_INDEXES = [
+    ('task_title_trgm_idx', 'core_task', 'title'),
+    ('task_description_trgm_idx', 'core_task', 'description'),
+    ('user_email_trgm_idx', 'core_user', 'email'),
+    ('user_name_trgm_idx', 'core_user', 'name'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_task_user_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
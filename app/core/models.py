@@ -25,12 +25,12 @@ class UserManager(BaseUserManager):
     
     def create_superuser(self, email, password):
         """Create and return a new superuser"""
-        user = self.create_user(email, password)
-        user.is_staff = True
-        user.is_superuser = True
-        user.save(using=self._db)
-
-        return user
+        return self.create_user(
+            email,
+            password,
+            is_staff=True,
+            is_superuser=True,
+        )
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -89,5 +89,11 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='task_user_created_idx'),
+            models.Index(fields=['user', '-id'], name='task_user_id_idx'),
+        ]
+
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -6,6 +6,8 @@ from django.contrib.auth import get_user_model
 from django.urls import reverse
 from django.http import HttpResponse
 
+from core.models import Task
+
 
 class AdminSiteTest(TestCase):
     """Test for Django admin"""
@@ -17,19 +19,23 @@ class AdminSiteTest(TestCase):
     TEST_USER_PASSWORD = 'testpass123'
     TEST_USER_NAME = 'Test User'
 
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create users once for the whole test case."""
+        cls.admin_user = get_user_model().objects.create_superuser(
+            email=cls.ADMIN_EMAIL,
+            password=cls.ADMIN_PASSWORD
+        )
+        cls.user = get_user_model().objects.create_user(
+            email=cls.TEST_USER_EMAIL,
+            password=cls.TEST_USER_PASSWORD,
+            name=cls.TEST_USER_NAME
+        )
+
     def setUp(self) -> None:
-        """Create user and client."""
+        """Create client."""
         self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
-            email=self.ADMIN_EMAIL,
-            password=self.ADMIN_PASSWORD
-        )
         self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
-            email=self.TEST_USER_EMAIL,
-            password=self.TEST_USER_PASSWORD,
-            name=self.TEST_USER_NAME
-        )
 
     def test_user_list(self) -> None:
         """Test that users are listed on page."""
@@ -54,4 +60,17 @@ class AdminSiteTest(TestCase):
         res: HttpResponse = self.client.get(url)
 
         self.assertEqual(res.status_code, 200)
-        self.assertTemplateUsed(res, 'admin/change_form.html')
\ No newline at end of file
+        self.assertTemplateUsed(res, 'admin/change_form.html')
+
+    def test_task_list(self) -> None:
+        """Test that tasks are listed without a query per owner."""
+        Task.objects.create(user=self.user, title='First task')
+        Task.objects.create(user=self.admin_user, title='Second task')
+        url = reverse('admin:core_task_changelist')
+
+        with self.assertNumQueries(7):
+            res: HttpResponse = self.client.get(url)
+
+        self.assertContains(res, 'First task')
+        self.assertContains(res, 'Second task')
+        self.assertEqual(res.status_code, 200)
@@ -0,0 +1,10 @@
+"""
+Pagination for the task API.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class TaskCursorPagination(CursorPagination):
+    """Keyset pagination over newest tasks first, without a COUNT query."""
+    page_size = 25
+    ordering = ('-created_at', '-id')
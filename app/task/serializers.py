@@ -1,6 +1,9 @@
 """
 Serializer for task management.
 """
+import copy
+from functools import cached_property
+
 from rest_framework import serializers
 from core.models import Task
 from django.utils import timezone
@@ -14,14 +17,44 @@ class TaskSerializer(serializers.ModelSerializer):
     created_at = serializers.DateTimeField(read_only=True)
     updated_at = serializers.DateTimeField(read_only=True)
 
+    # Set to False if Task grows save() logic or signal receivers
+    use_queryset_update = True
+    # Set to False to rebuild the field map on every instantiation
+    cache_fields = True
+
     class Meta:
         model = Task
-        fields = '__all__'
+        fields = [
+            'id',
+            'title',
+            'description',
+            'status',
+            'priority',
+            'due_date',
+            'user',
+            'created_at',
+            'updated_at',
+        ]
         read_only_fields = ['id', 'user', 'created_at', 'updated_at']
 
+    def get_fields(self):
+        """Return copies of the field map built once per serializer class."""
+        if not self.cache_fields:
+            return super().get_fields()
+        cls = type(self)
+        # Look in the class's own dict so subclasses build their own map
+        if '_field_cache' not in cls.__dict__:
+            cls._field_cache = super().get_fields()
+        return copy.deepcopy(cls._field_cache)
+
+    @cached_property
+    def today(self):
+        """Return today's date, computed once per request or serializer."""
+        return self.context.get('today') or timezone.localdate()
+
     def validate_due_date(self, value):
         """Validate that due_date is not in the past."""
-        if value and value < timezone.now().date():
+        if value and value < self.today:
             raise serializers.ValidationError("Due date cannot be in the past")
         return value
 
@@ -32,19 +65,38 @@ class TaskSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         """Update a task efficiently."""
+        if not self.use_queryset_update:
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save(update_fields=[*validated_data.keys(), 'updated_at'])
+            return instance
+
+        # Single UPDATE without model save signals; mirror it on the instance
+        validated_data['updated_at'] = timezone.now()
+        Task.objects.filter(pk=instance.pk).update(**validated_data)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save(update_fields=list(validated_data.keys()))
         return instance
 
-    def to_representation(self, instance):
-        """Convert the instance to a dictionary."""
-        representation = super().to_representation(instance)
-        # Add any additional computed fields or formatting here
-        return representation
 
 class TaskDetails(TaskSerializer):
     """Serializers for task details view"""
 
     class Meta(TaskSerializer.Meta):
-        fields = TaskSerializer.Meta.fields
\ No newline at end of file
+        fields = TaskSerializer.Meta.fields
+
+
+class TaskListSerializer(TaskSerializer):
+    """Serializer for the task list view, without the description."""
+
+    class Meta(TaskSerializer.Meta):
+        fields = [
+            'id',
+            'title',
+            'status',
+            'priority',
+            'due_date',
+            'user',
+            'created_at',
+            'updated_at',
+        ]
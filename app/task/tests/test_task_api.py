@@ -0,0 +1,238 @@
+"""
+Test suite for the Task API endpoints.
+
+This module contains tests for task-related API endpoints including:
+- Listing and retrieving tasks
+- Bulk task creation
+- Row-level access to other users' tasks
+"""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from core.models import Task
+from task.views import TaskViewSet
+
+# API Endpoint URLs
+TASKS_URL = reverse('task:task-list')
+BULK_TASKS_URL = reverse('task:task-bulk')
+
+
+# Helper Functions
+def detail_url(task_id):
+    """Create and return a task detail URL."""
+    return reverse('task:task-detail', args=[task_id])
+
+
+def create_user(**params):
+    """Create and return a new user with the given parameters."""
+    return get_user_model().objects.create_user(**params)
+
+
+def create_task(user, **params):
+    """Create and return a task owned by the given user."""
+    defaults = {'title': 'Sample task'}
+    defaults.update(params)
+    return Task.objects.create(user=user, **defaults)
+
+
+class PrivateTaskApiTests(TestCase):
+    """Test suite for task API endpoints (authentication required)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the whole test case."""
+        cls.user = create_user(email='user@example.com', password='testpass123')
+
+    def setUp(self):
+        """Set up test client and authenticate."""
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_list_tasks(self):
+        """Test listing only the user's tasks, without descriptions."""
+        create_task(user=self.user, description='Long description')
+        other_user = create_user(email='other@example.com', password='testpass123')
+        create_task(user=other_user)
+
+        res = self.client.get(TASKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['results']), 1)
+        self.assertEqual(res.data['results'][0]['user'], self.user.id)
+        self.assertNotIn('description', res.data['results'][0])
+
+    def test_list_tasks_paginated_by_cursor(self):
+        """Test the task list pages with a cursor instead of a count."""
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'Task {i}') for i in range(30)
+        )
+
+        res = self.client.get(TASKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', res.data)
+        self.assertEqual(len(res.data['results']), 25)
+        self.assertEqual(res.data['results'][0]['title'], 'Task 29')
+
+        res = self.client.get(res.data['next'])
+
+        self.assertEqual(len(res.data['results']), 5)
+        self.assertIsNone(res.data['next'])
+
+    def test_list_tasks_ignores_unsupported_ordering(self):
+        """Test due_date ordering falls back to the cursor-safe default."""
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'Undated {i}') for i in range(26)
+        )
+        Task.objects.bulk_create(
+            Task(user=self.user, title=f'Dated {i}', due_date=timezone.localdate())
+            for i in range(5)
+        )
+
+        expected = list(
+            Task.objects.filter(user=self.user)
+            .order_by('-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+
+        for ordering in ['due_date', '-due_date']:
+            with self.subTest(ordering=ordering):
+                seen = []
+                url = f'{TASKS_URL}?ordering={ordering}'
+                while url:
+                    res = self.client.get(url)
+                    self.assertEqual(res.status_code, status.HTTP_200_OK)
+                    seen.extend(task['id'] for task in res.data['results'])
+                    url = res.data['next']
+
+                self.assertEqual(seen, expected)
+
+    def test_unexpected_error_returns_generic_500(self):
+        """Test unexpected errors return a generic 500 without internals."""
+        with mock.patch.object(
+            TaskViewSet,
+            'get_queryset',
+            side_effect=RuntimeError('secret internal detail')
+        ), self.assertLogs('core.exceptions', level='ERROR'):
+            res = self.client.get(TASKS_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(res.data, {'error': 'An unexpected error occurred'})
+        self.assertNotIn('secret internal detail', res.content.decode())
+
+    def test_retrieve_task(self):
+        """Test retrieving a task owned by the user."""
+        task = create_task(user=self.user)
+
+        res = self.client.get(detail_url(task.id))
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['title'], task.title)
+        self.assertIn('description', res.data)
+
+    def test_retrieve_other_users_task_not_found(self):
+        """Test tasks of other users are not exposed."""
+        other_user = create_user(email='other@example.com', password='testpass123')
+        task = create_task(user=other_user)
+
+        res = self.client.get(detail_url(task.id))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_partial_update_task(self):
+        """Test partial update changes the task and its timestamp."""
+        task = create_task(user=self.user, title='Old title')
+        previous_updated_at = task.updated_at
+
+        res = self.client.patch(detail_url(task.id), {'title': 'New title'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['title'], 'New title')
+        task.refresh_from_db()
+        self.assertEqual(task.title, 'New title')
+        self.assertGreater(task.updated_at, previous_updated_at)
+
+    def test_bulk_create_tasks(self):
+        """Test creating several tasks in one request."""
+        payload = {'tasks': [{'title': 'Task one'}, {'title': 'Task two'}]}
+
+        res = self.client.post(BULK_TASKS_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(res.data), 2)
+        tasks = Task.objects.filter(user=self.user)
+        self.assertEqual(
+            sorted(tasks.values_list('title', flat=True)),
+            ['Task one', 'Task two']
+        )
+
+    def test_bulk_create_invalid_task_creates_nothing(self):
+        """Test one invalid task rejects the whole batch."""
+        payload = {'tasks': [{'title': 'Task one'}, {'title': 'x'}]}
+
+        res = self.client.post(BULK_TASKS_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+
+    def test_bulk_create_too_many_tasks_error(self):
+        """Test a batch over the size limit is rejected."""
+        payload = {'tasks': [{'title': f'Task {i}'} for i in range(3)]}
+
+        with mock.patch.object(TaskViewSet, 'bulk_max_tasks', 2):
+            res = self.client.post(BULK_TASKS_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+
+    def test_bulk_create_bare_list_error(self):
+        """Test tasks must be wrapped in a "tasks" key."""
+        payload = [{'title': 'Task one'}]
+
+        res = self.client.post(BULK_TASKS_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('tasks', res.data)
+        self.assertFalse(Task.objects.filter(user=self.user).exists())
+
+    def test_bulk_create_past_due_date_error(self):
+        """Test tasks due in the past are rejected."""
+        yesterday = timezone.localdate() - timedelta(days=1)
+        payload = {'tasks': [
+            {'title': 'Task one', 'due_date': timezone.localdate()},
+            {'title': 'Task two', 'due_date': yesterday},
+        ]}
+
+        res = self.client.post(BULK_TASKS_URL, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('due_date', res.data[1])
+
+    def test_delete_task(self):
+        """Test deleting a task owned by the user."""
+        task = create_task(user=self.user)
+
+        with self.assertNumQueries(1):
+            res = self.client.delete(detail_url(task.id))
+
+        self.assertEqual(res.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Task.objects.filter(id=task.id).exists())
+
+    def test_delete_other_users_task_not_found(self):
+        """Test tasks of other users cannot be deleted."""
+        other_user = create_user(email='other@example.com', password='testpass123')
+        task = create_task(user=other_user)
+
+        res = self.client.delete(detail_url(task.id))
+
+        self.assertEqual(res.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertTrue(Task.objects.filter(id=task.id).exists())
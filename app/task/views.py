@@ -3,16 +3,16 @@ Views for the task API
 """
 from typing import Any
 from rest_framework import viewsets, status, response
+from rest_framework.decorators import action
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.filters import SearchFilter, OrderingFilter
+from django.http import Http404
+from django.utils import timezone
 from core.models import Task
 from task import serializers
-from django.http import Http404
-import logging
-
-logger = logging.getLogger(__name__)
+from task.pagination import TaskCursorPagination
+from user.authentication import CachedJWTAuthentication
 
 
 class TaskViewSet(viewsets.ModelViewSet):
@@ -23,14 +23,21 @@ class TaskViewSet(viewsets.ModelViewSet):
     searching, and pagination capabilities.
     """
     serializer_class = serializers.TaskDetails
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['status', 'priority', 'due_date']
     search_fields = ['title', 'description']
-    ordering_fields = ['created_at', 'due_date', 'priority']
-    ordering = ['-created_at']
-    queryset = Task.objects.all()
+    # Cursor pagination positions on the first ordering field, so only
+    # non-null, near-unique fields can be offered to clients. Breaking:
+    # ?ordering=due_date and ?ordering=priority are no longer honoured and
+    # fall back to the default order below
+    ordering_fields = ['created_at']
+    ordering = ['-created_at', '-id']
+    pagination_class = TaskCursorPagination
+    bulk_batch_size = 1000
+    bulk_max_tasks = 1000
+    queryset = Task.objects.none()
     
     def get_queryset(self) -> Task.objects:
         """
@@ -39,12 +46,35 @@ class TaskViewSet(viewsets.ModelViewSet):
         Returns:
             QuerySet: Filtered and ordered tasks for the current user
         """
-        return (
-            Task.objects.filter(user=self.request.user)
-            .order_by('-id')
-            .distinct()
-        )
+        queryset = Task.objects.filter(user=self.request.user).order_by('-id')
+        if self.action == 'list':
+            # The list serializer never renders the description
+            queryset = queryset.defer('description')
+        return queryset
     
+    def get_serializer_class(self):
+        """
+        Return the serializer class for the current action.
+
+        Returns:
+            The lean list serializer for list requests, otherwise the
+            detail serializer
+        """
+        if self.action == 'list':
+            return serializers.TaskListSerializer
+        return self.serializer_class
+
+    def get_serializer_context(self) -> dict:
+        """
+        Add today's date so due date validation computes it only once.
+
+        Returns:
+            dict: The serializer context
+        """
+        context = super().get_serializer_context()
+        context['today'] = timezone.localdate()
+        return context
+
     def perform_create(self, serializer: serializers.TaskDetails) -> None:
         """
         Create a new task with the current user.
@@ -70,40 +100,64 @@ class TaskViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance)
         return response.Response(serializer.data)
     
-    def get_object(self) -> Task:
+    def destroy(self, request: Any, *args: Any, **kwargs: Any) -> response.Response:
         """
-        Get the task object for the current user.
-        
+        Delete a task of the current user with a single DELETE query.
+
+        Args:
+            request: The HTTP request
+            *args: Variable length argument list
+            **kwargs: Arbitrary keyword arguments
+
         Returns:
-            Task: The task object
-            
+            Response: Empty response on success
+
         Raises:
             Http404: If the task does not exist or belongs to another user
         """
-        obj = super().get_object()
-        if obj.user != self.request.user:
-            raise Http404("Task not found")
-        return obj
-    
-    def update(self, request, *args, **kwargs):
-        """Update a task."""
-        try:
-            return super().update(request, *args, **kwargs)
-        except Exception as e:
-            logger.error(f"Update error: {str(e)}", exc_info=True)
-            return response.Response(
-                {'error': f'An unexpected error occurred: {str(e)}'}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
-    
-    def destroy(self, request, *args, **kwargs):
-        """Delete a task."""
         try:
-            return super().destroy(request, *args, **kwargs)
-        except Exception:
+            deleted, _ = Task.objects.filter(
+                pk=kwargs['pk'],
+                user=request.user
+            ).delete()
+        except (TypeError, ValueError):
+            raise Http404('Task not found')
+        if not deleted:
+            raise Http404('Task not found')
+        return response.Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request: Any) -> response.Response:
+        """
+        Create many tasks for the current user in batched INSERTs.
+
+        Expects a payload of the form ``{"tasks": [{...}, {...}]}`` where
+        each item accepts the same fields as a single task POST. At most
+        ``bulk_max_tasks`` tasks are accepted per request.
+
+        Args:
+            request: The HTTP request containing the tasks to create
+
+        Returns:
+            Response: The created tasks
+        """
+        if not isinstance(request.data, dict) or 'tasks' not in request.data:
             return response.Response(
-                {'error': 'An unexpected error occurred'}, 
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                {'tasks': ['This field is required.']},
+                status=status.HTTP_400_BAD_REQUEST
             )
-    
-
+        serializer = self.get_serializer(
+            data=request.data['tasks'],
+            many=True,
+            max_length=self.bulk_max_tasks
+        )
+        serializer.is_valid(raise_exception=True)
+        objs = [
+            Task(user=request.user, **row)
+            for row in serializer.validated_data
+        ]
+        Task.objects.bulk_create(objs, batch_size=self.bulk_batch_size)
+        return response.Response(
+            self.get_serializer(objs, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 
@@ -125,6 +126,21 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/ref/settings/#caches
+
+# Cached JWT users and logins are dropped by user.signals, but only in the
+# cache of the process that saved the user. This per-process cache is only
+# safe with a single worker (gunicorn's default); run more workers and this
+# must point at a shared backend such as Redis or Memcached, or the others
+# keep serving stale users for up to JWT_USER_CACHE_TIMEOUT seconds.
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -144,6 +160,42 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Running under `manage.py test`
+TESTING = 'test' in sys.argv[1:2]
+
+
+class DisableMigrations:
+    """Migration modules mapping that makes every app build from its models."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+if TESTING:
+    # Hashing strength is irrelevant for tests and PBKDF2 dominates their runtime
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+    # Create the test schema straight from the models instead of replaying
+    # every migration
+    MIGRATION_MODULES = DisableMigrations()
+    # The suite uses no PostgreSQL-specific features, and an in-memory
+    # database needs no server round-trips or fsyncs
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+    # Per-process cache so clearing it between tests is a plain dict clear
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.1/topics/i18n/
 
@@ -171,7 +223,7 @@ AUTH_USER_MODEL = 'core.User'
 REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'user.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_THROTTLE_CLASSES': [
         'rest_framework.throttling.AnonRateThrottle',
@@ -182,9 +234,16 @@ REST_FRAMEWORK = {
         'user': '1000/day'      # Limit authenticated users to 1000 requests per day
     },
     'DATETIME_FORMAT': '%Y-%m-%dT%H:%M:%S.%fZ',
-    'DATETIME_INPUT_FORMATS': ['%Y-%m-%dT%H:%M:%S.%fZ', 'iso-8601']
+    'DATETIME_INPUT_FORMATS': ['%Y-%m-%dT%H:%M:%S.%fZ', 'iso-8601'],
+    'EXCEPTION_HANDLER': 'user.exceptions.auth_exception_handler',
 }
 
+if TESTING:
+    # A None rate makes throttles, including per-view ones, allow every
+    # request without touching the cache
+    REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = []
+    REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'] = {'anon': None, 'user': None}
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'TODO API',
 }
@@ -0,0 +1,49 @@
+"""
+Authentication classes for the API.
+"""
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+JWT_USER_CACHE_TIMEOUT = 60
+
+
+def jwt_user_cache_key(user_id) -> str:
+    """Return the cache key holding the user for a JWT user id."""
+    return f'jwt_user_{user_id}'
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWT authentication that caches the token's user for a short time.
+
+    Saves the user lookup on every authenticated request. Cached entries
+    are dropped whenever the user is saved or deleted (see user.signals),
+    but only in the cache that process uses; see the CACHES note in
+    settings for running several workers.
+    """
+
+    def get_user(self, validated_token):
+        """Return the token's user from the cache, loading it on a miss."""
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None:
+            return super().get_user(validated_token)
+
+        cache_key = jwt_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None or not self._passes_user_checks(user, validated_token):
+            # Reload so the checks in JWTAuthentication.get_user run
+            # against the current row rather than a stale cached copy
+            user = super().get_user(validated_token)
+            cache.set(cache_key, user, timeout=JWT_USER_CACHE_TIMEOUT)
+        return user
+
+    def _passes_user_checks(self, user, validated_token) -> bool:
+        """Re-apply JWTAuthentication's active and revoked-token checks."""
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            return False
+        if api_settings.CHECK_REVOKE_TOKEN:
+            token_hash = validated_token.get(api_settings.REVOKE_TOKEN_CLAIM)
+            if token_hash != get_md5_hash_password(user.password):
+                return False
+        return True
@@ -0,0 +1,34 @@
+"""
+Exception handling for the user API.
+"""
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from core.exceptions import api_exception_handler
+
+
+def is_authorization_error(exc) -> bool:
+    """Return True if a validation error carries an 'authorization' code."""
+    if not isinstance(exc, ValidationError) or not isinstance(exc.detail, dict):
+        return False
+    return any(
+        isinstance(errors, list) and any(
+            getattr(error, 'code', None) == 'authorization'
+            for error in errors
+        )
+        for errors in exc.detail.values()
+    )
+
+
+def auth_exception_handler(exc, context):
+    """Answer failed credential checks with 401 instead of 400.
+
+    Everything else is delegated to the project-wide API exception handler.
+    """
+    if is_authorization_error(exc):
+        return Response(
+            {'error': str(exc)},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    return api_exception_handler(exc, context)
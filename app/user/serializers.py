@@ -2,12 +2,29 @@
 Serializers for the user API View
 """
 from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.password_validation import validate_password
 from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+# Columns the login response needs from a cached credential hit
+AUTH_USER_FIELDS = [
+    'id',
+    'email',
+    'name',
+    'password',
+    'is_active',
+    'created_at',
+    'updated_at',
+]
+
+
+def auth_cache_key(email) -> str:
+    """Return the cache key holding login credentials for an email."""
+    return f'user_auth_{email}'
+
 
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the user object."""
@@ -60,6 +77,8 @@ class UserSerializer(serializers.ModelSerializer):
         validated_data.pop('confirm_password', None)
         password = validated_data.pop('password', None)
         
+        old_email = instance.email
+
         # Update user fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -72,11 +91,17 @@ class UserSerializer(serializers.ModelSerializer):
         if password:
             update_fields.append('password')
         
-        instance.save(update_fields=update_fields)
+        # auto_now is only written when listed, so stamp profile field
+        # changes only; a password-only save leaves updated_at alone
+        if validated_data:
+            update_fields.append('updated_at')
+        if update_fields:
+            instance.save(update_fields=update_fields)
         
         # Clear any cached user data
         cache_key = f'user_{instance.id}'
-        cache.delete(cache_key)
+        # The post_save receiver covers the token user and current email
+        cache.delete_many([cache_key, auth_cache_key(old_email)])
         
         return instance
 
@@ -112,10 +137,16 @@ class AuthTokenSerializer(serializers.Serializer):
                 code='authorization'
             )
 
-        # Try to get user from cache first
-        cache_key = f'user_auth_{email}'
-        user = cache.get(cache_key)
-        
+        # Try the cached credentials first, still verifying the password
+        cache_key = auth_cache_key(email)
+        cached = cache.get(cache_key)
+        user = None
+
+        if cached and check_password(password, cached['pwd']):
+            user = get_user_model().objects.only(*AUTH_USER_FIELDS).filter(
+                pk=cached['id']
+            ).first()
+
         if not user:
             user = authenticate(
                 request=self.context.get('request'),
@@ -124,8 +155,12 @@ class AuthTokenSerializer(serializers.Serializer):
             )
             
             if user:
-                # Cache the authenticated user for 5 minutes
-                cache.set(cache_key, user, timeout=300)
+                # Cache the user id and password hash for 5 minutes
+                cache.set(
+                    cache_key,
+                    {'id': user.id, 'pwd': user.password},
+                    timeout=300
+                )
         
         if not user:
             raise serializers.ValidationError(
@@ -0,0 +1,24 @@
+"""
+Signal receivers for the user app.
+"""
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.authentication import jwt_user_cache_key
+from user.serializers import auth_cache_key
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def clear_user_auth_cache(sender, instance, **kwargs):
+    """Drop cached auth data after admin or ORM changes to a user.
+
+    Only clears the cache this process uses, so other workers see the
+    change immediately only when CACHES is a shared backend.
+    """
+    cache.delete_many([
+        jwt_user_cache_key(instance.id),
+        auth_cache_key(instance.email),
+    ])
@@ -14,6 +14,11 @@ from django.core.cache import cache
 
 from rest_framework.test import APIClient
 from rest_framework import status
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from user.authentication import jwt_user_cache_key
+
+User = get_user_model()
 
 # API Endpoint URLs
 CREATE_USER_URL = reverse('user:create')
@@ -58,7 +63,23 @@ def create_user(**params):
     # Remove confirm_password if present as it's not needed for direct user creation
     params = params.copy()
     params.pop('confirm_password', None)
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
+
+
+def issue_refresh(user):
+    """Create and return a refresh token for the user without logging in."""
+    return str(RefreshToken.for_user(user))
+
+
+def create_user_fast(**params):
+    """Create and return a user with an unusable password, skipping hashing.
+
+    Only for tests that never authenticate with the user's password.
+    """
+    params = params.copy()
+    params.pop('confirm_password', None)
+    params.pop('password', None)
+    return User.objects.create(password='!', **params)
 
 
 class PublicUserApiTests(TestCase):
@@ -69,27 +90,17 @@ class PublicUserApiTests(TestCase):
         self.client = APIClient()
         cache.clear()
 
-    def tearDown(self):
-        """Clean up cache after each test."""
-        cache.clear()
-
     # User Registration Tests
     def test_create_user_successful(self):
         """Test successful user registration with valid data."""
         res = self.client.post(CREATE_USER_URL, VALID_USER_PAYLOAD)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        user = get_user_model().objects.get(email=VALID_USER_PAYLOAD['email'])
+        user = User.objects.get(email=VALID_USER_PAYLOAD['email'])
         self.assertTrue(user.check_password(VALID_USER_PAYLOAD['password']))
         self.assertNotIn('password', res.data)
         self.assertNotIn('confirm_password', res.data)
 
-    def test_user_with_email_exists_error(self):
-        """Test registration fails when email already exists."""
-        create_user(**VALID_USER_DETAILS)
-        res = self.client.post(CREATE_USER_URL, VALID_USER_PAYLOAD)
-        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-    
     def test_password_too_short_error(self):
         """Test registration fails when password is too short."""
         payload = {
@@ -99,7 +110,7 @@ class PublicUserApiTests(TestCase):
         }
         res = self.client.post(CREATE_USER_URL, payload)
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exist = get_user_model().objects.filter(
+        user_exist = User.objects.filter(
             email=payload['email']
         ).exists()
         self.assertFalse(user_exist)
@@ -115,16 +126,6 @@ class PublicUserApiTests(TestCase):
         self.assertIn('password', res.data)
 
     # Authentication Tests
-    def test_create_token_for_user(self):
-        """Test successful token generation with valid credentials."""
-        create_user(**VALID_USER_DETAILS)
-        res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
-
-        self.assertIn('access', res.data)   
-        self.assertIn('refresh', res.data)
-        self.assertIn('user', res.data)
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
-
     def test_create_token_bad_credentials(self):
         """Test token generation fails with invalid credentials."""
         create_user(email='test@example.com', password='goodpass')
@@ -155,65 +156,183 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
 
     # Token Refresh Tests
-    def test_refresh_token(self):
-        """Test successful token refresh with valid refresh token."""
-        create_user(**VALID_USER_DETAILS)
+    def test_refresh_token_invalid(self):
+        """Test token refresh fails with invalid refresh token."""
+        refresh_payload = {'refresh': 'invalid_token'}
+        res = self.client.post(TOKEN_RERESH_URL, refresh_payload)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    # Profile Access Tests
+    def test_retrieve_user_unauthorized(self):
+        """Test profile access requires authentication."""
+        res = self.client.get(ME_URL)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PublicUserApiExistingUserTests(TestCase):
+    """Test suite for public user API endpoints against an existing user."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the whole test case."""
+        cls.user = create_user(**VALID_USER_DETAILS)
+
+    def setUp(self):
+        """Set up test client and clear cache before each test."""
+        self.client = APIClient()
+        cache.clear()
 
-        # Get initial token
+    # User Registration Tests
+    def test_user_with_email_exists_error(self):
+        """Test registration fails when email already exists."""
+        res = self.client.post(CREATE_USER_URL, VALID_USER_PAYLOAD)
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    # Authentication Tests
+    def test_create_token_for_user(self):
+        """Test successful token generation with valid credentials."""
         res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.assertIn('access', res.data)   
         self.assertIn('refresh', res.data)
+        self.assertEqual(res.data['user'], {
+            'id': self.user.id,
+            'name': self.user.name,
+            'email': self.user.email,
+            'created_at': self.user.created_at,
+            'updated_at': self.user.updated_at
+        })
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_create_token_bad_credentials_after_login(self):
+        """Test a cached login does not accept a wrong password."""
+        res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        payload = {**VALID_LOGIN_PAYLOAD, 'password': 'badpass'}
+        res = self.client.post(TOKEN_URL, payload)
 
-        refresh_payload = {'refresh': res.data['refresh']}
+        self.assertNotIn('access', res.data)
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['user']['name'], VALID_USER_DETAILS['name'])
+
+    # Token Refresh Tests
+    def test_refresh_token(self):
+        """Test successful token refresh with valid refresh token."""
+        refresh_payload = {'refresh': issue_refresh(self.user)}
         refresh_res = self.client.post(TOKEN_RERESH_URL, refresh_payload)
 
         self.assertEqual(refresh_res.status_code, status.HTTP_200_OK)
         self.assertIn('access', refresh_res.data)
 
-    def test_refresh_token_invalid(self):
-        """Test token refresh fails with invalid refresh token."""
-        refresh_payload = {'refresh': 'invalid_token'}
-        res = self.client.post(TOKEN_RERESH_URL, refresh_payload)
-
-        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
-
     # Logout Tests
     def test_logout_successful(self):
         """Test successful user logout with valid refresh token."""
-        create_user(**VALID_USER_DETAILS)
+        refresh_token = issue_refresh(self.user)
 
-        # Get tokens
+        # Send logout request with refresh token
+        logout_res = self.client.post(LOGOUT_URL, {'refresh': refresh_token})
+
+        self.assertEqual(logout_res.status_code, status.HTTP_200_OK)
+
+        # The blacklisted token can no longer be refreshed
+        refresh_res = self.client.post(TOKEN_RERESH_URL, {'refresh': refresh_token})
+        self.assertEqual(refresh_res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_invalid_token(self):
+        """Test logout fails with an invalid refresh token."""
+        res = self.client.post(LOGOUT_URL, {'refresh': 'invalid_token'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_logout_non_object_body(self):
+        """Test logout rejects a JSON body that is not an object."""
+        res = self.client.post(LOGOUT_URL, [1], format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_admin_password_change_clears_cached_login(self):
+        """Test a cached login stops working after a password change."""
         res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertIn('refresh', res.data)
 
-        refresh_token = res.data['refresh']
+        self.user.set_password('changedpass123')
+        self.user.save()
+        res = self.client.post(TOKEN_URL, VALID_LOGIN_PAYLOAD)
 
-        # Send logout request with refresh token
-        logout_res = self.client.post(LOGOUT_URL, {'refresh': refresh_token})
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
-        self.assertEqual(logout_res.status_code, status.HTTP_200_OK)
 
-    # Profile Access Tests
-    def test_retrieve_user_unauthorized(self):
-        """Test profile access requires authentication."""
+class TokenAuthUserApiTests(TestCase):
+    """Test suite for requests authenticated with a bearer token."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the whole test case."""
+        cls.user = create_user(**VALID_USER_DETAILS)
+
+    def setUp(self):
+        """Set up test client and clear cache before each test."""
+        self.client = APIClient()
+        cache.clear()
+
+    def test_profile_update_refreshes_token_user(self):
+        """Test token-authenticated requests see profile updates."""
+        access = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        res = self.client.get(ME_URL)
+        self.assertEqual(res.data['name'], VALID_USER_DETAILS['name'])
+
+        self.client.patch(ME_URL, PARTIAL_PROFILE_UPDATE_PAYLOAD)
         res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['name'], PARTIAL_PROFILE_UPDATE_PAYLOAD['name'])
+
+    def test_deactivated_user_token_rejected(self):
+        """Test a cached token user is rejected once deactivated."""
+        access = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+        res = self.client.get(ME_URL)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        self.user.is_active = False
+        self.user.save()
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_cached_inactive_user_rejected(self):
+        """Test the active check also applies to a cache hit."""
+        User.objects.filter(id=self.user.id).update(is_active=False)
+        self.user.is_active = False
+        cache.set(jwt_user_cache_key(self.user.id), self.user)
+        access = RefreshToken.for_user(self.user).access_token
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+
+        res = self.client.get(ME_URL)
+
         self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class PrivateUserApiTests(TestCase):
     """Test suite for private user API endpoints (authentication required)."""
 
+    @classmethod
+    def setUpTestData(cls):
+        """Create the test user once for the whole test case."""
+        cls.user = create_user_fast(**VALID_USER_DETAILS)
+
     def setUp(self):
-        """Set up test client, create test user, and authenticate."""
-        self.user = create_user(**VALID_USER_DETAILS)
+        """Set up test client and authenticate."""
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
         cache.clear()
-
-    def tearDown(self):
-        """Clean up cache after each test."""
-        cache.clear()
     
     # Profile Retrieval Tests
     def test_retrieve_profile_success(self):
@@ -246,8 +365,24 @@ class PrivateUserApiTests(TestCase):
 
     def test_update_user_profile_partial(self):
         """Test successful partial profile update."""
+        previous_updated_at = self.user.updated_at
         res = self.client.patch(ME_URL, PARTIAL_PROFILE_UPDATE_PAYLOAD)
 
         self.user.refresh_from_db()
         self.assertEqual(self.user.name, PARTIAL_PROFILE_UPDATE_PAYLOAD['name'])
-        self.assertEqual(res.status_code, status.HTTP_200_OK)
\ No newline at end of file
+        self.assertGreater(self.user.updated_at, previous_updated_at)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_update_password_only_keeps_updated_at(self):
+        """Test a password-only update does not stamp updated_at."""
+        previous_updated_at = self.user.updated_at
+        payload = {
+            'password': 'newpassword123',
+            'confirm_password': 'newpassword123'
+        }
+        res = self.client.patch(ME_URL, payload)
+
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password(payload['password']))
+        self.assertEqual(self.user.updated_at, previous_updated_at)
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
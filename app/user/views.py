@@ -10,16 +10,25 @@ from typing import Any
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework_simplejwt.views import TokenObtainPairView
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.throttling import UserRateThrottle
-from rest_framework import serializers
 
 from core.models import User
+from user.authentication import CachedJWTAuthentication
 from user.serializers import UserSerializer, AuthTokenSerializer, LogoutSerializer
 
 
+def blacklist_token(refresh_token: str) -> None:
+    """Validate a refresh token and blacklist it so it cannot be reused.
+
+    Raises:
+        TokenError: If the token is invalid, expired or already blacklisted
+    """
+    RefreshToken(refresh_token).blacklist()
+
+
 class CreateUserView(generics.CreateAPIView):
     """Create a new user in the system.
     
@@ -42,38 +51,30 @@ class LoginView(TokenObtainPairView):
 
     def post(self, request, *args, **kwargs):
         """Handle login request and return tokens with user data."""
-        try:
-            serializer = self.get_serializer(data=request.data)
-            serializer.is_valid(raise_exception=True)
-            
-            # Get the validated user
-            user = serializer.validated_data['user']
-            
-            # Generate tokens
-            refresh = RefreshToken.for_user(user)
-            
-            # Get user data using UserSerializer
-            user_data = UserSerializer(user).data
-            
-            # Return tokens and user data
-            return Response({
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
-                'user': user_data
-            })
-        except serializers.ValidationError as e:
-            # Check if this is an authentication error
-            if isinstance(e.detail, dict):
-                for field, errors in e.detail.items():
-                    if isinstance(errors, list) and any(
-                        error.code == 'authorization' 
-                        for error in errors
-                    ):
-                        return Response(
-                            {'error': str(e)},
-                            status=status.HTTP_401_UNAUTHORIZED
-                        )
-            raise
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        # Get the validated user
+        user = serializer.validated_data['user']
+        
+        # Generate tokens
+        refresh = RefreshToken.for_user(user)
+        
+        # Same shape as UserSerializer output, without its field loop
+        user_data = {
+            'id': user.id,
+            'name': user.name,
+            'email': user.email,
+            'created_at': user.created_at,
+            'updated_at': user.updated_at,
+        }
+        
+        # Return tokens and user data
+        return Response({
+            'refresh': str(refresh),
+            'access': str(refresh.access_token),
+            'user': user_data
+        })
 
 
 class LogoutView(generics.GenericAPIView):
@@ -95,29 +96,28 @@ class LogoutView(generics.GenericAPIView):
         Returns:
             Response: Success or error message with appropriate status code
         """
-        try:
+        refresh_token = None
+        if isinstance(request.data, dict):
             refresh_token = request.data.get('refresh')
-            if not refresh_token:
-                return Response(
-                    {'error': 'Refresh token is required'}, 
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            # Validate and blacklist the token
-            token = RefreshToken(refresh_token)
-            token.blacklist()
-            
+        if not refresh_token:
             return Response(
-                {'message': 'Successfully logged out'}, 
-                status=status.HTTP_200_OK
+                {'error': 'Refresh token is required'}, 
+                status=status.HTTP_400_BAD_REQUEST
             )
-            
-        except Exception:
+
+        try:
+            blacklist_token(refresh_token)
+        except TokenError:
             return Response(
                 {'error': 'Invalid refresh token'}, 
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        return Response(
+            {'message': 'Successfully logged out'}, 
+            status=status.HTTP_200_OK
+        )
+
 
 class ManageUserView(generics.RetrieveUpdateAPIView):
     """Manage the authenticated user's profile.
@@ -128,7 +128,7 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
     - Requires authentication for all operations
     """
     serializer_class = UserSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
     throttle_classes = [UserRateThrottle]
 
@@ -139,7 +139,34 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
             The currently authenticated user instance
         """
         return self.request.user
-    
+
+    def retrieve(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+        """Return the authenticated user's profile.
+        
+        Returns:
+            Response: The serialized user
+        """
+        return Response(self.serializer_class(request.user).data)
+
+    def update(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+        """Update the authenticated user's profile.
+        
+        Handles both PUT and PATCH; ``partial`` is passed by
+        ``partial_update``.
+        
+        Returns:
+            Response: The serialized, updated user
+        """
+        serializer = self.serializer_class(
+            request.user,
+            data=request.data,
+            partial=kwargs.pop('partial', False)
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+
 class UserListView(generics.ListAPIView):
     """List all users in the system.
     